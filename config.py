@@ -41,6 +41,12 @@ EXPERIMENT_PREFIX = os.getenv("EXPERIMENT_PREFIX", f"{AGENT_MODEL}-experiment")
 AGENT_MAX_ITERATIONS = int(os.getenv("AGENT_MAX_ITERATIONS", "20"))
 AGENT_MAX_EXECUTION_TIME = int(os.getenv("AGENT_MAX_EXECUTION_TIME", "300"))
 
+# Market data caching (Yahoo Finance responses reused within the TTL window)
+YF_CACHE_TTL_SECONDS = int(os.getenv("YF_CACHE_TTL_SECONDS", "900"))
+YF_CACHE_DIR = os.getenv("YF_CACHE_DIR", os.path.join(".cache", "yf"))
+# Symbols whose 1y history is fetched in the background when the agent's tools are created
+PRELOAD_SYMBOLS = os.getenv("PRELOAD_SYMBOLS", "AAPL MSFT GOOGL AMZN META TSLA NVDA").split()
+
 # Optional cost control
 MAX_EXAMPLES = os.getenv("MAX_EXAMPLES")
 if MAX_EXAMPLES is not None:
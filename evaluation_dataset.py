@@ -134,10 +134,13 @@ EXPECTED_TRAJECTORIES = {
 AVALIBLE_FINANCIAL_TOOLS = [
     "tavily_search_results_json",
     "get_stock_price",
+    "get_stock_prices",
     "get_company_info",
+    "get_companies_info",
     "calculate_compound_growth",
     "calculate_financial_ratio",
-    "get_financial_history"
+    "get_financial_history",
+    "get_financial_histories"
 ]
 
 def create_langsmith_dataset(dataset_name: str = "Financial-Agent-Evaluation-Dataset", max_examples: int = None) -> str:
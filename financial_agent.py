@@ -10,7 +10,7 @@ from langchain.agents import AgentExecutor, create_react_agent
 from langchain_core.prompts import PromptTemplate
 from langsmith import Client
 from langsmith.run_helpers import traceable
-from financial_tools import FINANCIAL_TOOLS
+from financial_tools import get_financial_tools
 import config
 import pandas as pd
 
@@ -24,7 +24,7 @@ class FinancialAgent:
 
     def __init__(self):
         """Initialize the financial agent with tools and LLM."""
-        self.tools = FINANCIAL_TOOLS
+        self.tools = get_financial_tools()
         self.llm = config.get_chat_model()
         self.agent = self._create_agent()
         self.agent_executor = AgentExecutor(
@@ -46,8 +46,11 @@ AVAILABLE TOOLS:
 
 TOOL INPUT FORMAT:
 - get_stock_price: Use MSFT (symbol only)
+- get_stock_prices: Use AAPL MSFT NVDA (space-separated symbols)
 - get_company_info: Use AAPL (symbol only)
+- get_companies_info: Use AAPL MSFT (space-separated symbols)
 - get_financial_history: Use AAPL 5y (symbol and period)
+- get_financial_histories: Use AAPL 5y, MSFT 5y (comma-separated symbol and period pairs)
 - calculate_compound_growth: Use 10000 0.07 10 (principal rate years)
 - calculate_financial_ratio: Use 82.50 5.50 pe (numerator denominator type)
 - tavily_search_results_json: Use Microsoft stock price (search query)
@@ -59,7 +62,7 @@ FINANCIAL TOOL USAGE GUIDELINES:
 - For compound growth: Use calculate_compound_growth("PRINCIPAL RATE YEARS")
 - For financial ratios: Use calculate_financial_ratio("NUMERATOR DENOMINATOR TYPE")
 - For recent news/events: Use tavily_search_results_json
-- STRUCTURED OUTPUT: Financial tools return validated Pydantic models for reliability
+- STRUCTURED OUTPUT: Financial tools return structured records with consistent fields
 - MINIMIZE TOOL CALLS: Plan your tool usage efficiently before starting
 - Combine multiple data points in single tool calls when possible
 - Always verify financial figures with reliable sources
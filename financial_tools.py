@@ -1,42 +1,69 @@
 """
 Financial Tools for LangChain Agent
 
-Professional financial analysis tools with structured outputs using Pydantic models.
+Professional financial analysis tools with structured dict outputs built from typed records.
 All tools follow LangChain best practices for reliable agent integration.
 """
+import bisect
+import hashlib
+import logging
+import math
+import os
+import pickle
+import tempfile
+import threading
+import time
 import yfinance as yf
+from yfinance.exceptions import YFException
+# curl_cffi is yfinance's HTTP client (a yfinance dependency); its transport errors surface unwrapped
+from curl_cffi.requests.exceptions import RequestException as CurlRequestException
 import pandas as pd
 import numpy as np
-from typing import Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from functools import cache, lru_cache
+from typing import ClassVar, List, Optional
 from langchain_core.tools import tool
 from langchain_tavily import TavilySearch
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError, field_validator
 import config
+from indicators import history_metrics, rsi, sma
 
-# Pydantic models for structured outputs
-class StockPriceData(BaseModel):
+logger = logging.getLogger(__name__)
+
+# Failures expected from a market data lookup: yfinance/HTTP errors plus missing or malformed
+# fields in the response. Anything else is a bug and should propagate.
+_MARKET_DATA_ERRORS = (YFException, CurlRequestException, KeyError, ValueError, TypeError)
+
+# Typed records for tool outputs. Tools hand the agent plain dicts (see _as_dict) so LangChain and
+# LangSmith can serialize them directly, without a Pydantic validate/dump round trip per call.
+@dataclass(frozen=True, slots=True)
+class StockPriceData:
     """Stock price and key metrics."""
-    symbol: str = Field(description="Stock ticker symbol")
-    current_price: Optional[float] = Field(description="Current stock price")
-    market_cap: Optional[int] = Field(description="Market capitalization")
-    pe_ratio: Optional[float] = Field(description="Price-to-earnings ratio")
-    week_52_high: Optional[float] = Field(description="52-week high price")
-    week_52_low: Optional[float] = Field(description="52-week low price")
-    formatted_summary: str = Field(description="Human-readable summary")
+    symbol: str                        # Stock ticker symbol
+    current_price: Optional[float]     # Current stock price
+    market_cap: Optional[int]          # Market capitalization
+    pe_ratio: Optional[float]          # Price-to-earnings ratio
+    week_52_high: Optional[float]      # 52-week high price
+    week_52_low: Optional[float]       # 52-week low price
+    formatted_summary: str             # Human-readable summary
     error: Optional[str] = None
 
-class CompanyInfo(BaseModel):
+@dataclass(frozen=True, slots=True)
+class CompanyInfo:
     """Company information and fundamentals."""
-    symbol: str = Field(description="Stock ticker symbol")
-    name: Optional[str] = Field(description="Company name")
-    sector: Optional[str] = Field(description="Business sector")
-    industry: Optional[str] = Field(description="Industry classification")
-    country: Optional[str] = Field(description="Country of incorporation")
-    employees: Optional[int] = Field(description="Number of employees")
-    business_summary: Optional[str] = Field(description="Business description")
+    symbol: str                        # Stock ticker symbol
+    name: Optional[str]                # Company name
+    sector: Optional[str]              # Business sector
+    industry: Optional[str]            # Industry classification
+    country: Optional[str]             # Country of incorporation
+    employees: Optional[int]           # Number of employees
+    business_summary: Optional[str]    # Business description
     error: Optional[str] = None
 
-class FinancialHistoryResult(BaseModel):
+@dataclass(frozen=True, slots=True)
+class FinancialHistoryResult:
     """Historical performance analysis."""
     symbol: str
     period: str
@@ -46,11 +73,14 @@ class FinancialHistoryResult(BaseModel):
     cagr_percent: Optional[float] = None
     volatility_percent: Optional[float] = None
     max_drawdown_percent: Optional[float] = None
+    sma_50: Optional[float] = None
+    rsi_14: Optional[float] = None
     trading_days: Optional[int] = None
     formatted_summary: Optional[str] = None
     error: Optional[str] = None
 
-class CompoundGrowthResult(BaseModel):
+@dataclass(frozen=True, slots=True)
+class CompoundGrowthResult:
     """Compound growth calculation results."""
     principal: float
     annual_rate: float
@@ -61,7 +91,8 @@ class CompoundGrowthResult(BaseModel):
     formatted_summary: str
     error: Optional[str] = None
 
-class FinancialRatioResult(BaseModel):
+@dataclass(frozen=True, slots=True)
+class FinancialRatioResult:
     """Financial ratio calculation and interpretation."""
     numerator: float
     denominator: float
@@ -73,25 +104,305 @@ class FinancialRatioResult(BaseModel):
     formatted_summary: Optional[str] = None
     error: Optional[str] = None
 
-@tool
-def get_stock_price(symbol: str) -> StockPriceData:
-    """
-    Get current stock price and key metrics.
+# Error records for the tool failure paths
+def _stock_price_error(symbol: str, message: str) -> StockPriceData:
+    return StockPriceData(
+        symbol=symbol,
+        current_price=None,
+        market_cap=None,
+        pe_ratio=None,
+        week_52_high=None,
+        week_52_low=None,
+        formatted_summary=f"Error retrieving stock data for {symbol}: {message}",
+        error=message
+    )
 
-    Args:
-        symbol: Stock ticker symbol (e.g., 'AAPL', 'TSLA', 'NVDA')
+def _company_info_error(symbol: str, message: str) -> CompanyInfo:
+    return CompanyInfo(
+        symbol=symbol,
+        name=None,
+        sector=None,
+        industry=None,
+        country=None,
+        employees=None,
+        business_summary=f"Error retrieving company info for {symbol}: {message}",
+        error=message
+    )
 
-    Returns:
-        Structured stock price data with current price, market cap, and ratios
+def _history_error(symbol: str, period: str, message: str, formatted_summary: str) -> FinancialHistoryResult:
+    return FinancialHistoryResult(
+        symbol=symbol,
+        period=period,
+        formatted_summary=formatted_summary,
+        error=message
+    )
+
+def _compound_growth_error(message: str) -> CompoundGrowthResult:
+    return CompoundGrowthResult(
+        principal=0.0,
+        annual_rate=0.0,
+        years=0.0,
+        future_value=0.0,
+        total_growth=0.0,
+        total_return_percent=0.0,
+        formatted_summary="",
+        error=f"Calculation error: {message}"
+    )
+
+def _financial_ratio_error(message: str) -> FinancialRatioResult:
+    return FinancialRatioResult(
+        numerator=0.0,
+        denominator=0.0,
+        ratio_type="error",
+        error=f"Calculation error: {message}"
+    )
+
+def _as_dict(record) -> dict:
+    """Shallow dict of an output record; fields are all scalars, so asdict()'s deep copy is unnecessary."""
+    return {name: getattr(record, name) for name in record.__slots__}
+
+# Pydantic models for tool arguments.
+# The ReAct agent passes each tool a single space-separated string, so these are not registered as
+# args_schema; from_query() maps the tokens onto the fields in order and lets Pydantic coerce and
+# validate them in one step.
+class _QueryArgs(BaseModel):
+    """Base class for arguments parsed from a space-separated tool query."""
+
+    query_format: ClassVar[str]
+
+    @classmethod
+    def from_query(cls, query: str):
+        """Parse a query, raising a one-line ValueError (instead of Pydantic's multi-line dump) on bad input."""
+        try:
+            return cls.model_validate(dict(zip(cls.model_fields, query.split())))
+        except ValidationError as e:
+            details = "; ".join(f"{err['loc'][0]}: {err['msg']}" if err['loc'] else err['msg'] for err in e.errors())
+            raise ValueError(f'{details} (expected "{cls.query_format}")') from None
+
+class FinancialHistoryArgs(_QueryArgs):
+    """Arguments for get_financial_history: "SYMBOL PERIOD"."""
+    query_format: ClassVar[str] = "SYMBOL PERIOD"
+    symbol: str = Field(description="Stock ticker symbol")
+    period: str = Field(default="1y", description="History period (e.g., 1y, 5y, max)")
+
+    @field_validator("symbol")
+    @classmethod
+    def _upper_symbol(cls, value: str) -> str:
+        return value.upper()
+
+    @field_validator("period")
+    @classmethod
+    def _lower_period(cls, value: str) -> str:
+        return value.lower()
+
+class CompoundGrowthArgs(_QueryArgs):
+    """Arguments for calculate_compound_growth: "PRINCIPAL RATE YEARS"."""
+    query_format: ClassVar[str] = "PRINCIPAL RATE YEARS"
+    principal: float = Field(gt=0, description="Initial investment")
+    annual_rate: float = Field(ge=-1, description="Annual growth rate as a decimal (e.g., 0.07)")
+    years: float = Field(gt=0, description="Investment horizon in years")
+
+class FinancialRatioArgs(_QueryArgs):
+    """Arguments for calculate_financial_ratio: "NUMERATOR DENOMINATOR TYPE"."""
+    query_format: ClassVar[str] = "NUMERATOR DENOMINATOR TYPE"
+    numerator: float
+    denominator: float
+    ratio_type: str = "generic"
+
+    @field_validator("ratio_type")
+    @classmethod
+    def _lower_ratio_type(cls, value: str) -> str:
+        return value.lower()
+
+# Shared pool for multi-symbol tools; yfinance calls are I/O-bound so threads overlap network waits
+_EXECUTOR = ThreadPoolExecutor(max_workers=16)
+
+def _cache_bucket() -> int:
+    """Current cache time bucket; entries keyed by an older bucket are expired."""
+    return int(time.time() // config.YF_CACHE_TTL_SECONDS)
+
+@lru_cache(maxsize=256)
+def _ticker(symbol: str, bucket: int) -> yf.Ticker:
+    """Cached Ticker per TTL bucket, used for history requests."""
+    return yf.Ticker(symbol)
+
+# Ticker info per (symbol, TTL bucket). Only successful fetches are stored: yfinance's own .info memo
+# marks a Ticker as fetched before the request completes, so a failed or in-flight fetch would read as None.
+_INFO_CACHE = {}
+_INFO_LOCKS = {}
+_INFO_CACHE_LOCK = threading.Lock()
+
+def _info_lock(key: tuple) -> threading.Lock:
+    """Per-key lock so concurrent lookups of one symbol wait for a single fetch."""
+    with _INFO_CACHE_LOCK:
+        # Drop entries from expired buckets
+        for stale in [k for k in _INFO_LOCKS if k[1] != key[1]]:
+            _INFO_LOCKS.pop(stale, None)
+            _INFO_CACHE.pop(stale, None)
+        return _INFO_LOCKS.setdefault(key, threading.Lock())
+
+def _cached_info(symbol: str) -> dict:
+    """Ticker info, served from memory for repeat lookups within the TTL window."""
+    key = (symbol, _cache_bucket())
+    info = _INFO_CACHE.get(key)
+    if info is not None:
+        return info
+
+    with _info_lock(key):
+        info = _INFO_CACHE.get(key)
+        if info is None:
+            # A fresh Ticker each attempt, so a failed fetch is retried on the next call
+            info = yf.Ticker(symbol).get_info()
+            if not isinstance(info, dict) or not info:
+                raise YFException(f"No quote data returned for {symbol}")
+            _INFO_CACHE[key] = info
+    return info
+
+def _first(info: dict, *keys: str):
+    """Value of the first key present (non-None) in info, probing each key once."""
+    for key in keys:
+        value = info.get(key)
+        if value is not None:
+            return value
+    return None
+
+# Only closing prices feed the history metrics; other OHLCV columns are dropped before caching
+HISTORY_COLUMNS = ["Close"]
+
+def _history_cache_path(symbol: str, period: str) -> str:
+    key = hashlib.sha1(f"{symbol}:{period}".encode()).hexdigest()
+    return os.path.join(config.YF_CACHE_DIR, f"{key}.pkl")
+
+# In-memory LRU layer over the disk cache: (symbol, period) -> (fetched_at, DataFrame)
+_HISTORY_MEMORY = OrderedDict()
+_HISTORY_MEMORY_MAX_ENTRIES = 256
+_HISTORY_MEMORY_LOCK = threading.Lock()
+
+def _remember_history(symbol: str, period: str, fetched_at: float, hist: pd.DataFrame) -> None:
+    """Add a history frame to the in-memory cache, evicting the least recently used beyond the cap."""
+    with _HISTORY_MEMORY_LOCK:
+        _HISTORY_MEMORY[(symbol, period)] = (fetched_at, hist)
+        _HISTORY_MEMORY.move_to_end((symbol, period))
+        while len(_HISTORY_MEMORY) > _HISTORY_MEMORY_MAX_ENTRIES:
+            _HISTORY_MEMORY.popitem(last=False)
+
+def _load_history(symbol: str, period: str) -> Optional[pd.DataFrame]:
+    """Cached price history if the in-memory or on-disk entry is fresher than the TTL, else None."""
+    key = (symbol, period)
+    with _HISTORY_MEMORY_LOCK:
+        entry = _HISTORY_MEMORY.get(key)
+        if entry is not None:
+            if time.time() - entry[0] < config.YF_CACHE_TTL_SECONDS:
+                _HISTORY_MEMORY.move_to_end(key)
+                return entry[1]
+            del _HISTORY_MEMORY[key]  # Expired
+
+    path = _history_cache_path(symbol, period)
+    try:
+        fetched_at = os.path.getmtime(path)
+        if time.time() - fetched_at < config.YF_CACHE_TTL_SECONDS:
+            hist = pd.read_pickle(path)
+            _remember_history(symbol, period, fetched_at, hist)
+            return hist
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, ValueError):
+        pass  # Missing or unreadable cache entry
+    return None
+
+def _store_history(symbol: str, period: str, hist: pd.DataFrame) -> None:
+    """Save price history to the in-memory and on-disk caches (disk is best-effort)."""
+    if hist.empty:
+        return
+    _remember_history(symbol, period, time.time(), hist)
+    try:
+        os.makedirs(config.YF_CACHE_DIR, exist_ok=True)
+        # Write then rename so concurrent readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=config.YF_CACHE_DIR, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            hist.to_pickle(f)
+        os.replace(tmp_path, _history_cache_path(symbol, period))
+    except OSError:
+        pass
+
+def _cached_history(symbol: str, period: str) -> pd.DataFrame:
+    """Price history, served from the on-disk pickle cache when fresher than the TTL."""
+    hist = _load_history(symbol, period)
+    if hist is None:
+        hist = _ticker(symbol, _cache_bucket()).history(
+            period=period, auto_adjust=True, actions=False, prepost=False, raise_errors=False
+        )
+        hist = hist[HISTORY_COLUMNS] if not hist.empty else hist
+        _store_history(symbol, period, hist)
+    return hist
+
+# yf.download collects results in module-global state (shared._DFS/_ERRORS) that every call resets,
+# so overlapping downloads from the pool, the preload thread or parallel evaluations must not interleave
+_DOWNLOAD_LOCK = threading.Lock()
+
+def _download_histories(symbols: List[str], period: str) -> dict:
+    """
+    Price history for several symbols sharing one period.
+
+    Uncached symbols are fetched with a single batched yf.download call instead of
+    one request per symbol. Returns a dict of symbol -> DataFrame; symbols the batch
+    returned no data for are omitted so callers fall back to a per-symbol fetch.
     """
+    frames = {}
+    missing = []
+    for symbol in symbols:
+        hist = _load_history(symbol, period)
+        if hist is None:
+            missing.append(symbol)
+        else:
+            frames[symbol] = hist
+
+    if len(missing) == 1:
+        frames[missing[0]] = _cached_history(missing[0], period)
+    elif missing:
+        with _DOWNLOAD_LOCK:
+            data = yf.download(
+                missing, period=period, group_by="ticker", auto_adjust=True, actions=False,
+                prepost=False, threads=True, progress=False
+            )
+        downloaded = set(data.columns.get_level_values(0))
+        for symbol in missing:
+            if symbol not in downloaded:
+                continue
+            hist = data[symbol][HISTORY_COLUMNS].dropna(how="all")
+            if hist.empty:
+                continue
+            _store_history(symbol, period, hist)
+            frames[symbol] = hist
+
+    return frames
+
+def _preload_histories() -> None:
+    """Warm the history cache for commonly requested symbols with one batched download."""
+    try:
+        _download_histories(config.PRELOAD_SYMBOLS, "1y")
+    except _MARKET_DATA_ERRORS as e:
+        logger.warning("History preload failed: %s", e)
+
+@cache
+def _start_preload() -> None:
+    """Start the background preload once per process; cold symbols are unaffected."""
+    if config.PRELOAD_SYMBOLS:
+        threading.Thread(target=_preload_histories, name="history-preload", daemon=True).start()
+
+def _parse_symbols(symbols: str) -> List[str]:
+    """Split a space- or comma-separated symbol list into unique upper-case tickers."""
+    return list(dict.fromkeys(s.upper() for s in symbols.replace(",", " ").split()))
+
+def _fetch_stock_price(symbol: str) -> StockPriceData:
+    """Fetch price data for a single symbol (used by both single and batch tools)."""
     try:
         symbol = symbol.upper().strip()
-        ticker = yf.Ticker(symbol)
-        info = ticker.info
 
-        current_price = info.get('currentPrice') or info.get('regularMarketPrice')
+        # P/E is only available from info, so every field comes from that one (cached) payload;
+        # fast_info would add chart and shares requests on top of it
+        info = _cached_info(symbol)
+        current_price = _first(info, 'currentPrice', 'regularMarketPrice')
         market_cap = info.get('marketCap')
-        pe_ratio = info.get('trailingPE') or info.get('forwardPE')
+        pe_ratio = _first(info, 'trailingPE', 'forwardPE')
         week_52_high = info.get('fiftyTwoWeekHigh')
         week_52_low = info.get('fiftyTwoWeekLow')
 
@@ -119,37 +430,44 @@ def get_stock_price(symbol: str) -> StockPriceData:
             formatted_summary=" | ".join(summary_parts)
         )
 
-    except Exception as e:
-        return StockPriceData(
-            symbol=symbol,
-            current_price=None,
-            market_cap=None,
-            pe_ratio=None,
-            week_52_high=None,
-            week_52_low=None,
-            formatted_summary=f"Error retrieving stock data for {symbol}: {str(e)}",
-            error=str(e)
-        )
+    except _MARKET_DATA_ERRORS as e:
+        return _stock_price_error(symbol, str(e))
 
 @tool
-def get_company_info(symbol: str) -> CompanyInfo:
+def get_stock_price(symbol: str) -> dict:
     """
-    Get detailed company information.
+    Get current stock price and key metrics.
 
     Args:
-        symbol: Stock ticker symbol (e.g., 'AAPL', 'MSFT')
+        symbol: Stock ticker symbol (e.g., 'AAPL', 'TSLA', 'NVDA')
 
     Returns:
-        Structured company information including sector, industry, and business details
+        Structured stock price data with current price, market cap, and ratios
+    """
+    return _as_dict(_fetch_stock_price(symbol))
+
+@tool
+def get_stock_prices(symbols: str) -> List[dict]:
     """
+    Get current stock price and key metrics for several stocks at once.
+
+    Args:
+        symbols: Space-separated ticker symbols (e.g., "AAPL MSFT NVDA")
+
+    Returns:
+        List of structured stock price data, one entry per symbol in input order
+    """
+    return [_as_dict(result) for result in _EXECUTOR.map(_fetch_stock_price, _parse_symbols(symbols))]
+
+def _fetch_company_info(symbol: str) -> CompanyInfo:
+    """Fetch company information for a single symbol."""
     try:
         symbol = symbol.upper().strip()
-        ticker = yf.Ticker(symbol)
-        info = ticker.info
+        info = _cached_info(symbol)
 
         return CompanyInfo(
             symbol=symbol,
-            name=info.get('longName') or info.get('shortName'),
+            name=_first(info, 'longName', 'shortName'),
             sector=info.get('sector'),
             industry=info.get('industry'),
             country=info.get('country'),
@@ -157,20 +475,79 @@ def get_company_info(symbol: str) -> CompanyInfo:
             business_summary=info.get('longBusinessSummary', 'No business summary available')
         )
 
-    except Exception as e:
-        return CompanyInfo(
+    except _MARKET_DATA_ERRORS as e:
+        return _company_info_error(symbol, str(e))
+
+@tool
+def get_company_info(symbol: str) -> dict:
+    """
+    Get detailed company information.
+
+    Args:
+        symbol: Stock ticker symbol (e.g., 'AAPL', 'MSFT')
+
+    Returns:
+        Structured company information including sector, industry, and business details
+    """
+    return _as_dict(_fetch_company_info(symbol))
+
+@tool
+def get_companies_info(symbols: str) -> List[dict]:
+    """
+    Get detailed company information for several companies at once.
+
+    Args:
+        symbols: Space-separated ticker symbols (e.g., "AAPL MSFT GOOGL")
+
+    Returns:
+        List of structured company information, one entry per symbol in input order
+    """
+    return [_as_dict(result) for result in _EXECUTOR.map(_fetch_company_info, _parse_symbols(symbols))]
+
+def _fetch_history(symbol: str, period: str, hist: Optional[pd.DataFrame] = None) -> FinancialHistoryResult:
+    """Compute performance metrics for a symbol, fetching its price history unless already provided."""
+    try:
+        if hist is None:
+            hist = _cached_history(symbol, period)
+
+        closes = hist['Close'].dropna().to_numpy(dtype=np.float64) if not hist.empty else np.empty(0)
+        if closes.size == 0:
+            return _history_error(symbol, period, "No data available", f"No historical data available for {symbol}")
+
+        # Calculate metrics in a single compiled pass over the closing prices
+        start_price, end_price, total_return, cagr, volatility, max_drawdown, trading_days = history_metrics(closes)
+
+        # Latest technical indicator values (NaN when the history is shorter than the window)
+        sma_50 = sma(closes, 50)[-1]
+        rsi_14 = rsi(closes, 14)[-1]
+
+        formatted_summary = f"{symbol} Performance ({period}): " + ", ".join([
+            f"Total Return: {total_return:.2f}%",
+            f"CAGR: {cagr:.2f}%",
+            f"Volatility: {volatility:.2f}%",
+            f"Max Drawdown: {max_drawdown:.2f}%"
+        ])
+
+        return FinancialHistoryResult(
             symbol=symbol,
-            name=None,
-            sector=None,
-            industry=None,
-            country=None,
-            employees=None,
-            business_summary=f"Error retrieving company info for {symbol}: {str(e)}",
-            error=str(e)
+            period=period,
+            start_price=round(float(start_price), 2),
+            end_price=round(float(end_price), 2),
+            total_return_percent=round(float(total_return), 2),
+            cagr_percent=round(float(cagr), 2),
+            volatility_percent=round(float(volatility), 2),
+            max_drawdown_percent=round(float(max_drawdown), 2),
+            sma_50=round(float(sma_50), 2) if np.isfinite(sma_50) else None,
+            rsi_14=round(float(rsi_14), 2) if np.isfinite(rsi_14) else None,
+            trading_days=trading_days,
+            formatted_summary=formatted_summary
         )
 
+    except _MARKET_DATA_ERRORS as e:
+        return _history_error(symbol, period, str(e), f"Error retrieving financial history: {str(e)}")
+
 @tool
-def get_financial_history(query: str) -> FinancialHistoryResult:
+def get_financial_history(query: str) -> dict:
     """
     Get historical performance and calculate key metrics.
 
@@ -181,65 +558,48 @@ def get_financial_history(query: str) -> FinancialHistoryResult:
         Historical performance analysis with returns, CAGR, volatility, and drawdown
     """
     try:
-        # Parse query
-        parts = query.strip().split()
-        symbol = parts[0].upper() if parts else query.upper()
-        period = parts[1].lower() if len(parts) > 1 else "1y"
-
-        ticker = yf.Ticker(symbol)
-        hist = ticker.history(period=period)
-
-        if hist.empty:
-            return FinancialHistoryResult(
-                symbol=symbol,
-                period=period,
-                formatted_summary=f"No historical data available for {symbol}",
-                error="No data available"
-            )
+        args = FinancialHistoryArgs.from_query(query)
+    except ValueError as e:
+        return _as_dict(_history_error('UNKNOWN', 'UNKNOWN', str(e), f"Error retrieving financial history: {str(e)}"))
 
-        # Calculate metrics
-        start_price = hist['Close'].iloc[0]
-        end_price = hist['Close'].iloc[-1]
-        total_return = ((end_price - start_price) / start_price) * 100
+    return _as_dict(_fetch_history(args.symbol, args.period))
 
-        # CAGR calculation
-        years = len(hist) / 252  # Trading days per year
-        cagr = ((end_price / start_price) ** (1/years) - 1) * 100 if years > 0 else 0
+@tool
+def get_financial_histories(query: str) -> List[dict]:
+    """
+    Get historical performance for several stocks at once.
+
+    Args:
+        query: Comma-separated "SYMBOL PERIOD" entries (e.g., "AAPL 5y, MSFT 5y, TSLA 2y")
 
-        # Volatility (annualized)
-        daily_returns = hist['Close'].pct_change().dropna()
-        volatility = daily_returns.std() * np.sqrt(252) * 100
+    Returns:
+        List of historical performance analyses, one entry per requested symbol
+    """
+    entries = [FinancialHistoryArgs.from_query(part) for part in query.split(",") if part.strip()]
 
-        # Max drawdown
-        rolling_max = hist['Close'].expanding().max()
-        drawdown = (hist['Close'] - rolling_max) / rolling_max
-        max_drawdown = drawdown.min() * 100
+    # One batched download per distinct period
+    symbols_by_period = {}
+    for args in entries:
+        symbols_by_period.setdefault(args.period, []).append(args.symbol)
 
-        formatted_summary = f"{symbol} Performance ({period}): Total Return: {total_return:.2f}%, CAGR: {cagr:.2f}%, Volatility: {volatility:.2f}%, Max Drawdown: {max_drawdown:.2f}%"
+    futures = {
+        _EXECUTOR.submit(_download_histories, list(dict.fromkeys(symbols)), period): period
+        for period, symbols in symbols_by_period.items()
+    }
 
-        return FinancialHistoryResult(
-            symbol=symbol,
-            period=period,
-            start_price=round(start_price, 2),
-            end_price=round(end_price, 2),
-            total_return_percent=round(total_return, 2),
-            cagr_percent=round(cagr, 2),
-            volatility_percent=round(volatility, 2),
-            max_drawdown_percent=round(max_drawdown, 2),
-            trading_days=len(hist),
-            formatted_summary=formatted_summary
-        )
+    frames = {}
+    for future in as_completed(futures):
+        period = futures[future]
+        try:
+            for symbol, hist in future.result().items():
+                frames[(symbol, period)] = hist
+        except _MARKET_DATA_ERRORS as e:
+            logger.debug("Batched history download for period %s failed, fetching per symbol: %s", period, e)
 
-    except Exception as e:
-        return FinancialHistoryResult(
-            symbol=symbol if 'symbol' in locals() else 'UNKNOWN',
-            period=period if 'period' in locals() else 'UNKNOWN',
-            formatted_summary=f"Error retrieving financial history: {str(e)}",
-            error=str(e)
-        )
+    return [_as_dict(_fetch_history(args.symbol, args.period, frames.get((args.symbol, args.period)))) for args in entries]
 
 @tool
-def calculate_compound_growth(query: str) -> CompoundGrowthResult:
+def calculate_compound_growth(query: str) -> dict:
     """
     Calculate compound growth and future value.
 
@@ -250,24 +610,22 @@ def calculate_compound_growth(query: str) -> CompoundGrowthResult:
         Future value, growth, and return calculations
     """
     try:
-        parts = query.strip().split()
-        if len(parts) < 3:
-            raise ValueError("Query must contain principal, annual_rate, and years")
-
-        principal = float(parts[0])
-        annual_rate = float(parts[1])
-        years = float(parts[2])
-
-        if years <= 0 or principal <= 0:
-            raise ValueError("Principal and years must be positive")
-
-        future_value = principal * (1 + annual_rate) ** years
+        args = CompoundGrowthArgs.from_query(query)
+        principal, annual_rate, years = args.principal, args.annual_rate, args.years
+
+        if annual_rate == -1:
+            # A -100% rate wipes out the investment; log1p(-1) is outside the log domain
+            future_value, total_return_pct = 0.0, -100.0
+        else:
+            # Growth exponent in log space: accurate for small rates and avoids the generic ** dispatch
+            log_growth = years * math.log1p(annual_rate)
+            future_value = principal * math.exp(log_growth)
+            total_return_pct = math.expm1(log_growth) * 100
         total_growth = future_value - principal
-        total_return_pct = (future_value / principal - 1) * 100
 
         formatted_summary = f"Investment: ${principal:,.2f} at {annual_rate*100:.2f}% for {years} years → Future Value: ${future_value:,.2f} (Total Return: {total_return_pct:.2f}%)"
 
-        return CompoundGrowthResult(
+        return _as_dict(CompoundGrowthResult(
             principal=principal,
             annual_rate=annual_rate,
             years=years,
@@ -275,22 +633,23 @@ def calculate_compound_growth(query: str) -> CompoundGrowthResult:
             total_growth=round(total_growth, 2),
             total_return_percent=round(total_return_pct, 2),
             formatted_summary=formatted_summary
-        )
+        ))
 
-    except Exception as e:
-        return CompoundGrowthResult(
-            principal=0.0,
-            annual_rate=0.0,
-            years=0.0,
-            future_value=0.0,
-            total_growth=0.0,
-            total_return_percent=0.0,
-            formatted_summary="",
-            error=f"Calculation error: {str(e)}"
-        )
+    except (ValueError, OverflowError) as e:
+        return _as_dict(_compound_growth_error(str(e)))
+
+# Ratio interpretations: type -> (description, breakpoints, labels).
+# A value strictly above breakpoints[i] earns labels[i + 1]; values at or below the first breakpoint get labels[0].
+_RATIO_INFO = {
+    'pe': ("Price-to-Earnings Ratio", (15, 25), ("Low", "Moderate", "High")),
+    'debt_to_equity': ("Debt-to-Equity Ratio", (1,), ("Conservative", "High leverage")),
+    'current': ("Current Ratio", (1.5,), ("Potential concern", "Good liquidity")),
+    'roe': ("Return on Equity", (0.10, 0.15), ("Weak", "Average", "Strong")),
+    'generic': ("Financial Ratio", (), ("Custom calculation",))
+}
 
 @tool
-def calculate_financial_ratio(query: str) -> FinancialRatioResult:
+def calculate_financial_ratio(query: str) -> dict:
     """
     Calculate and interpret financial ratios.
 
@@ -301,33 +660,20 @@ def calculate_financial_ratio(query: str) -> FinancialRatioResult:
         Ratio value, interpretation, and context
     """
     try:
-        parts = query.strip().split()
-        if len(parts) < 2:
-            raise ValueError("Query must contain at least numerator and denominator")
-
-        numerator = float(parts[0])
-        denominator = float(parts[1])
-        ratio_type = parts[2].lower() if len(parts) > 2 else "generic"
+        args = FinancialRatioArgs.from_query(query)
+        numerator, denominator, ratio_type = args.numerator, args.denominator, args.ratio_type
 
         if denominator == 0:
             raise ValueError("Denominator cannot be zero")
 
         ratio_value = numerator / denominator
 
-        # Ratio interpretations
-        ratio_info = {
-            'pe': ("Price-to-Earnings Ratio", "High" if ratio_value > 25 else "Moderate" if ratio_value > 15 else "Low"),
-            'debt_to_equity': ("Debt-to-Equity Ratio", "High leverage" if ratio_value > 1 else "Conservative"),
-            'current': ("Current Ratio", "Good liquidity" if ratio_value > 1.5 else "Potential concern"),
-            'roe': ("Return on Equity", "Strong" if ratio_value > 0.15 else "Average" if ratio_value > 0.10 else "Weak"),
-            'generic': ("Financial Ratio", "Custom calculation")
-        }
-
-        description, context = ratio_info.get(ratio_type, ratio_info['generic'])
+        description, breakpoints, labels = _RATIO_INFO.get(ratio_type, _RATIO_INFO['generic'])
+        context = labels[bisect.bisect_left(breakpoints, ratio_value)]
         interpretation = f"{description}: {ratio_value:.2f}"
         formatted_summary = f"{description}: {ratio_value:.2f} - {context}"
 
-        return FinancialRatioResult(
+        return _as_dict(FinancialRatioResult(
             numerator=numerator,
             denominator=denominator,
             ratio_type=ratio_type,
@@ -336,42 +682,50 @@ def calculate_financial_ratio(query: str) -> FinancialRatioResult:
             interpretation=interpretation,
             context=context,
             formatted_summary=formatted_summary
-        )
+        ))
 
-    except Exception as e:
-        return FinancialRatioResult(
-            numerator=0.0,
-            denominator=0.0,
-            ratio_type="error",
-            error=f"Calculation error: {str(e)}"
+    except ValueError as e:
+        return _as_dict(_financial_ratio_error(str(e)))
+
+@cache
+def _tavily() -> Optional[TavilySearch]:
+    """Tavily search tool, created on first use; None if it cannot be initialized."""
+    try:
+        return TavilySearch(
+            api_key=config.TAVILY_API_KEY,
+            max_results=5,
+            search_depth="advanced",
+            include_answer=True,
+            include_raw_content=False,
+            include_images=False
         )
+    except ValueError as e:
+        logger.warning("Tavily search not available: %s", e)
+        return None
 
-# Initialize Tavily search tool
-try:
-    tavily_search = TavilySearch(
-        api_key=config.TAVILY_API_KEY,
-        max_results=5,
-        search_depth="advanced",
-        include_answer=True,
-        include_raw_content=False,
-        include_images=False
-    )
-    FINANCIAL_TOOLS = [
-        get_stock_price,
-        get_company_info,
-        get_financial_history,
-        calculate_compound_growth,
-        calculate_financial_ratio,
-        tavily_search
-    ]
-except Exception as e:
-    print(f"Warning: Tavily search not available: {e}")
-    FINANCIAL_TOOLS = [
+def get_financial_tools() -> list:
+    """All financial tools for the agent, including Tavily search when available."""
+    _start_preload()
+
+    tools = [
         get_stock_price,
+        get_stock_prices,
         get_company_info,
+        get_companies_info,
         get_financial_history,
+        get_financial_histories,
         calculate_compound_growth,
         calculate_financial_ratio
     ]
-
-print(f"Loaded {len(FINANCIAL_TOOLS)} financial tools")
\ No newline at end of file
+    tavily_search = _tavily()
+    if tavily_search is not None:
+        tools.append(tavily_search)
+
+    logger.info("Loaded %d financial tools", len(tools))
+    return tools
+
+def __getattr__(name: str):
+    # FINANCIAL_TOOLS is resolved lazily so importing this module has no network side effects
+    if name == "FINANCIAL_TOOLS":
+        return get_financial_tools()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,124 @@
+"""
+Numerical Kernels for Financial Tools
+
+Numba-compiled price-series kernels used by the financial tools: the single-pass
+performance metrics behind get_financial_history and technical indicators (SMA, RSI).
+When the optional numbatalib package is installed its TA-Lib compatible indicators
+are used instead of the built-in kernels.
+"""
+import math
+import numpy as np
+from numba import njit
+
+try:
+    import numbatalib
+except ImportError:
+    numbatalib = None
+
+# Annualization constants. Passed to kernels as default arguments so Numba compiles them as constants.
+TRADING_DAYS = 252
+SQRT_TRADING_DAYS = math.sqrt(TRADING_DAYS)
+
+# error_model="numpy" drops the per-division ZeroDivisionError checks from the loop (IEEE inf/nan instead)
+@njit(cache=True, fastmath=True, error_model="numpy")
+def history_metrics(closes, trading_days_per_year=TRADING_DAYS, sqrt_trading_days=SQRT_TRADING_DAYS):
+    """
+    Performance metrics for a series of closing prices in one pass.
+
+    Returns (start_price, end_price, total_return_pct, cagr_pct, volatility_pct,
+    max_drawdown_pct, trading_days). Volatility is the annualized sample std of
+    daily returns; CAGR assumes TRADING_DAYS trading days per year. An empty
+    array yields NaN metrics and zero trading days.
+    """
+    n = closes.shape[0]
+    if n == 0:
+        # Bounds checking is off under @njit, so an empty array must never reach the indexing below
+        return np.nan, np.nan, np.nan, np.nan, np.nan, np.nan, 0
+
+    start_price = closes[0]
+    end_price = closes[n - 1]
+
+    running_max = start_price
+    max_drawdown = 0.0
+    # Welford's running mean / sum of squared deviations: stable, and no returns array is allocated
+    ret_mean = 0.0
+    ret_m2 = 0.0
+    for i in range(1, n):
+        price = closes[i]
+        daily_return = price / closes[i - 1] - 1.0
+        delta = daily_return - ret_mean
+        ret_mean += delta / i
+        ret_m2 += delta * (daily_return - ret_mean)
+
+        if price > running_max:
+            running_max = price
+        drawdown = price / running_max - 1.0
+        if drawdown < max_drawdown:
+            max_drawdown = drawdown
+
+    total_return = (end_price / start_price - 1.0) * 100
+    years = n / trading_days_per_year
+    cagr = ((end_price / start_price) ** (1.0 / years) - 1.0) * 100
+
+    m = n - 1  # number of daily returns
+    volatility = np.nan
+    if m > 1:
+        volatility = np.sqrt(ret_m2 / (m - 1)) * sqrt_trading_days * 100
+
+    return start_price, end_price, total_return, cagr, volatility, max_drawdown * 100, n
+
+@njit(cache=True, fastmath=True)
+def _sma_kernel(x, window):
+    n = x.shape[0]
+    out = np.full(n, np.nan)
+    if window <= 0 or window > n:
+        return out
+
+    # Serial on purpose: series are at most a few thousand points, and parallel launches from
+    # concurrent agent threads can abort the process on Numba's workqueue threading layer
+    csum = np.cumsum(x)
+    out[window - 1] = csum[window - 1] / window
+    for i in range(window, n):
+        out[i] = (csum[i] - csum[i - window]) / window
+    return out
+
+@njit(cache=True, fastmath=True)
+def _rsi_kernel(x, window):
+    n = x.shape[0]
+    out = np.full(n, np.nan)
+    if window <= 0 or window >= n:
+        return out
+
+    # Seed with simple averages, then apply Wilder's smoothing (inherently sequential)
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, window + 1):
+        change = x[i] - x[i - 1]
+        if change > 0:
+            avg_gain += change
+        else:
+            avg_loss -= change
+    avg_gain /= window
+    avg_loss /= window
+    out[window] = 100.0 if avg_loss == 0 else 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+    for i in range(window + 1, n):
+        change = x[i] - x[i - 1]
+        gain = change if change > 0 else 0.0
+        loss = -change if change < 0 else 0.0
+        avg_gain = (avg_gain * (window - 1) + gain) / window
+        avg_loss = (avg_loss * (window - 1) + loss) / window
+        out[i] = 100.0 if avg_loss == 0 else 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    return out
+
+def sma(x: np.ndarray, window: int) -> np.ndarray:
+    """Simple moving average; NaN until a full window is available."""
+    if numbatalib is not None:
+        return numbatalib.SMA(x, timeperiod=window)
+    return _sma_kernel(x, window)
+
+def rsi(x: np.ndarray, window: int = 14) -> np.ndarray:
+    """Wilder's Relative Strength Index (0-100); NaN until window + 1 prices are available."""
+    if numbatalib is not None:
+        return numbatalib.RSI(x, timeperiod=window)
+    return _rsi_kernel(x, window)
@@ -0,0 +1,86 @@
+"""
+Tests for the ticker info cache in financial_tools.py.
+
+yfinance is replaced by a fake Ticker so no network access is needed.
+"""
+import os
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("yfinance")
+
+# config.py validates API keys at import time
+os.environ.setdefault("LANGSMITH_API_KEY", "test")
+os.environ.setdefault("OPENAI_API_KEY", "test")
+
+import financial_tools
+
+INFO = {"currentPrice": 190.5, "marketCap": 3_000_000_000_000, "longName": "Apple Inc.", "sector": "Technology"}
+
+class FakeTicker:
+    """Stand-in for yf.Ticker whose get_info() returns (or raises) the next queued response."""
+    responses = []
+    calls = 0
+    delay = 0.0
+
+    def __init__(self, symbol, session=None):
+        self.symbol = symbol
+
+    def get_info(self):
+        cls = type(self)
+        cls.calls += 1
+        time.sleep(cls.delay)
+        response = cls.responses.pop(0) if cls.responses else INFO
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+@pytest.fixture(autouse=True)
+def fake_ticker(monkeypatch):
+    """Fresh info cache and fake Ticker for every test."""
+    monkeypatch.setattr(financial_tools, "_INFO_CACHE", {})
+    monkeypatch.setattr(financial_tools, "_INFO_LOCKS", {})
+    monkeypatch.setattr(financial_tools.yf, "Ticker", FakeTicker)
+    monkeypatch.setattr(FakeTicker, "responses", [])
+    monkeypatch.setattr(FakeTicker, "calls", 0)
+    monkeypatch.setattr(FakeTicker, "delay", 0.0)
+
+@pytest.mark.parametrize("failure", [financial_tools.YFException("rate limited"), None, "not a dict"])
+def test_failed_info_fetch_is_retried(failure):
+    FakeTicker.responses = [failure]
+
+    price = financial_tools._fetch_stock_price("AAPL")
+    assert price.error is not None
+
+    price = financial_tools._fetch_stock_price("AAPL")
+    assert price.error is None
+    assert price.current_price == 190.5
+
+    company = financial_tools._fetch_company_info("AAPL")
+    assert company.error is None
+    assert company.name == "Apple Inc."
+    assert FakeTicker.calls == 2
+
+def test_concurrent_lookups_share_one_fetch():
+    FakeTicker.delay = 0.2
+    barrier = threading.Barrier(2)
+    results = []
+
+    def lookup(fetch):
+        barrier.wait()
+        results.append(fetch("AAPL"))
+
+    threads = [
+        threading.Thread(target=lookup, args=(financial_tools._fetch_stock_price,)),
+        threading.Thread(target=lookup, args=(financial_tools._fetch_company_info,)),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(results) == 2
+    assert all(result.error is None for result in results)
+    assert FakeTicker.calls == 1
@@ -0,0 +1,84 @@
+"""
+Regression tests for the Numba kernels in indicators.py.
+
+Each kernel is compared against the pandas / TA-Lib definition it replaces.
+"""
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pd = pytest.importorskip("pandas")
+pytest.importorskip("numba")
+
+import indicators
+
+@pytest.fixture(autouse=True)
+def builtin_kernels(monkeypatch):
+    """Always exercise the built-in kernels, even when numbatalib is installed."""
+    monkeypatch.setattr(indicators, "numbatalib", None)
+
+@pytest.fixture
+def closes():
+    rng = np.random.default_rng(42)
+    returns = rng.normal(0.0005, 0.02, size=1260)
+    return 100.0 * np.cumprod(1.0 + returns)
+
+def _reference_rsi(x, window):
+    """Wilder's RSI as defined by TA-Lib: SMA-seeded averages, then (n-1)/n smoothing."""
+    out = np.full(len(x), np.nan)
+    if len(x) <= window:
+        return out
+    changes = np.diff(x)
+    avg_gain = np.clip(changes[:window], 0, None).mean()
+    avg_loss = -np.clip(changes[:window], None, 0).mean()
+    out[window] = 100.0 if avg_loss == 0 else 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    for i in range(window + 1, len(x)):
+        change = changes[i - 1]
+        avg_gain = (avg_gain * (window - 1) + max(change, 0.0)) / window
+        avg_loss = (avg_loss * (window - 1) + max(-change, 0.0)) / window
+        out[i] = 100.0 if avg_loss == 0 else 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    return out
+
+def test_history_metrics_matches_pandas(closes):
+    series = pd.Series(closes)
+    start_price, end_price = series.iloc[0], series.iloc[-1]
+    years = len(series) / 252
+    expected_cagr = ((end_price / start_price) ** (1 / years) - 1) * 100
+    expected_volatility = series.pct_change().dropna().std() * math.sqrt(252) * 100
+    rolling_max = series.expanding().max()
+    expected_drawdown = ((series - rolling_max) / rolling_max).min() * 100
+
+    start, end, total_return, cagr, volatility, max_drawdown, trading_days = indicators.history_metrics(closes)
+
+    assert start == pytest.approx(start_price)
+    assert end == pytest.approx(end_price)
+    assert total_return == pytest.approx((end_price - start_price) / start_price * 100)
+    assert cagr == pytest.approx(expected_cagr)
+    assert volatility == pytest.approx(expected_volatility)
+    assert max_drawdown == pytest.approx(expected_drawdown)
+    assert trading_days == len(closes)
+
+def test_history_metrics_empty_array():
+    *metrics, trading_days = indicators.history_metrics(np.empty(0))
+    assert all(math.isnan(value) for value in metrics)
+    assert trading_days == 0
+
+@pytest.mark.parametrize("window", [1, 20, 50])
+def test_sma_matches_pandas_rolling_mean(closes, window):
+    expected = pd.Series(closes).rolling(window).mean().to_numpy()
+    np.testing.assert_allclose(indicators.sma(closes, window), expected, rtol=1e-9, equal_nan=True)
+
+def test_sma_window_longer_than_series():
+    assert np.isnan(indicators.sma(np.arange(10.0), 50)).all()
+
+@pytest.mark.parametrize("window", [2, 14])
+def test_rsi_matches_wilder_definition(closes, window):
+    result = indicators.rsi(closes, window)
+    np.testing.assert_allclose(result, _reference_rsi(closes, window), rtol=1e-9, equal_nan=True)
+    assert np.nanmin(result) >= 0 and np.nanmax(result) <= 100
+
+def test_rsi_all_gains_is_100():
+    result = indicators.rsi(np.arange(1.0, 31.0), 14)
+    assert np.isnan(result[:14]).all()
+    np.testing.assert_allclose(result[14:], 100.0)